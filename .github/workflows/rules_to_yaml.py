@@ -1,20 +1,28 @@
 from lkmlstyle.rules import ALL_RULES
 import yaml
 
-yamls = []
+try:
+    # The libyaml dumper is C-implemented and much faster than the pure-Python one
+    from yaml import CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeDumper
+
+serialized = []
 for rule in ALL_RULES:
+    rule_dict = rule.as_dict()
     try:
-        yaml.safe_dump(rule.__dict__(), allow_unicode=True)
-    except Exception as e:
+        yaml.dump(rule_dict, Dumper=SafeDumper, allow_unicode=True)
+    except yaml.YAMLError as e:
         print(e)
-        print(rule.__dict__(), end="\n\n")
+        print(rule_dict, end="\n\n")
     else:
-        yamls.append(rule)
+        serialized.append(rule_dict)
 
 with open("rules.yaml", "w+") as file:
-    yaml.safe_dump(
-        {"rules": [r.__dict__() for r in yamls]},
+    yaml.dump(
+        {"rules": serialized},
         file,
+        Dumper=SafeDumper,
         allow_unicode=True,
         sort_keys=False,
     )
@@ -1,3 +1,3 @@
-from lkmlstyle.check import check
+from lkmlstyle.check import check, check_tree
 
-__all__ = ["check"]
+__all__ = ["check", "check_tree"]
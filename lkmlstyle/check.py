@@ -1,16 +1,26 @@
-from collections import deque
+from collections import defaultdict
 from dataclasses import dataclass
+from functools import lru_cache
 import logging
+import sys
 import yaml
 import lkml
 from lkml.visitors import BasicVisitor
-from lkml.tree import SyntaxNode, SyntaxToken, ContainerNode
+from lkml.tree import (
+    DocumentNode,
+    SyntaxNode,
+    SyntaxToken,
+    ContainerNode,
+    ListNode,
+    PairNode,
+)
 from lkmlstyle.rules import (
     NodeContext,
     Rule,
     ALL_RULES,
 )
 from lkmlstyle.exceptions import InvalidConfig, InvalidRuleCode
+from lkmlstyle.utils import reset_param_cache
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
@@ -41,10 +51,13 @@ def choose_rules(
     if select and not isinstance(select, tuple):
         raise TypeError("Codes to select must be wrapped in a tuple")
 
-    rules_by_code = {rule.code: rule for rule in ruleset}
-    codeset = set(rules_by_code.keys())
+    # Frozensets once up front, so membership tests below are hashed lookups
+    # instead of linear scans over the ignore/select tuples for every rule
+    codeset = frozenset(rule.code for rule in ruleset)
+    ignored = frozenset(ignore or tuple())
+    selected = frozenset(select or tuple())
 
-    invalid_rules = set((ignore or tuple()) + (select or tuple())) - codeset
+    invalid_rules = (ignored | selected) - codeset
     if invalid_rules:
         suffix = (
             "are not valid rule codes"
@@ -53,13 +66,13 @@ def choose_rules(
         )
         raise InvalidRuleCode(f"{', '.join(invalid_rules)} {suffix}")
 
-    codes = codeset & set(select or codeset) - set(ignore or tuple())
+    # selected is already validated as a subset of codeset
+    codes = (selected or codeset) - ignored
     if not codes:
         return ruleset
-    rules = []
-    for code in codes:
-        rules.append(rules_by_code[code])
-    return tuple(rules)
+    # Filtering the ruleset (rather than iterating the chosen codes) keeps the
+    # rules in their definition order instead of arbitrary set order
+    return tuple(rule for rule in ruleset if rule.code in codes)
 
 
 @dataclass
@@ -137,67 +150,175 @@ def parse_config() -> Config | None:
         return None
 
 
-def track_lineage(method):
-    def wrapper(self, node, *args, **kwargs):
-        try:
-            node_type = node.type.value
-        except AttributeError:
-            node_type = None
-
-        if node_type is not None:
-            self._lineage.append(node_type)
-
-        method(self, node, *args, **kwargs)
-
-        if node_type is not None:
-            self._lineage.pop()
-
-    return wrapper
+# Sentinel marking where a node's subtree ends on the visitor's explicit stack
+_POP_LINEAGE = object()
 
 
 class StyleCheckVisitor(BasicVisitor):
     def __init__(self, ruleset: tuple[Rule, ...]):
         super().__init__()
         self.ruleset = ruleset
-        self._lineage: deque = deque()  # Faster than list for append/pop
+        # A rule can only select a node whose type matches the final component of
+        # one of its selectors, so bucket rules by that component. Each node then
+        # only considers its own bucket instead of scanning the whole ruleset.
+        rules_by_tail: defaultdict[str, list[Rule]] = defaultdict(list)
+        for rule in ruleset:
+            for selector in rule.select:
+                # Interned to match the interned node types pushed during the
+                # walk, making bucket lookups a pointer comparison
+                tail = sys.intern(selector.rsplit(".", 1)[-1])
+                if rule not in rules_by_tail[tail]:
+                    rules_by_tail[tail].append(rule)
+        self._rules_by_tail: dict[str, tuple[Rule, ...]] = {
+            tail: tuple(rules) for tail, rules in rules_by_tail.items()
+        }
+        self._lineage: list[str] = []
+        # Maintained incrementally on push/pop so rule checks don't re-join
+        self._lineage_str: str = ""
+        # Lineage strings repeat constantly (every dimension in a view shares
+        # one), so memoize which bucketed rules select each lineage
+        self._rules_for_lineage: dict[str, tuple[Rule, ...]] = {}
         self.violations: list[tuple] = []
         self.context = NodeContext()
 
     @property
     def lineage(self) -> str:
-        return ".".join(self._lineage)
+        return self._lineage_str
 
-    @track_lineage
     def _visit(self, node: SyntaxNode | SyntaxToken) -> None:
         if isinstance(node, SyntaxToken):
             return
 
-        if not isinstance(node, ContainerNode):
-            for rule in self.ruleset:
-                if rule.applies_to(node, self.lineage):
-                    logger.debug(f"Checking if {repr(node)} follows {repr(rule)}")
-                    follows, self.context = rule.followed_by(node, self.context)
-                    if not follows:
-                        self.violations.append(
-                            (
-                                rule.code,
-                                rule.title,
-                                rule.rationale,
-                                node.line_number,
+        # Walk the subtree iteratively with an explicit stack rather than
+        # recursing through each child's accept(), which would create a Python
+        # frame per node and risk the recursion limit on deeply nested files.
+        # Node children never include tokens, so the loop below doesn't need
+        # the token check that the entry point above does.
+        rules_by_tail = self._rules_by_tail
+        rules_for_lineage = self._rules_for_lineage
+        lineage = self._lineage
+        violations = self.violations
+        stack: list = [node]
+        while stack:
+            item = stack.pop()
+            if item is _POP_LINEAGE:
+                lineage.pop()
+                self._lineage_str = self._lineage_str.rpartition(".")[0]
+                continue
+
+            node = item
+            type_token = getattr(node, "type", None)
+            if type_token is not None:
+                node_type = sys.intern(type_token.value)
+                lineage.append(node_type)
+                self._lineage_str = (
+                    f"{self._lineage_str}.{node_type}"
+                    if self._lineage_str
+                    else node_type
+                )
+                stack.append(_POP_LINEAGE)
+
+            # Nodes without a lineage (e.g. the document root) can't be
+            # selected. ContainerNode has no subclasses, so class identity is
+            # enough and skips the isinstance MRO walk
+            if node.__class__ is not ContainerNode and lineage:
+                lineage_str = self._lineage_str
+                selected = rules_for_lineage.get(lineage_str)
+                if selected is None:
+                    selected = tuple(
+                        rule
+                        for rule in rules_by_tail.get(lineage[-1], ())
+                        if rule.selects(lineage_str)
+                    )
+                    rules_for_lineage[lineage_str] = selected
+                for rule in selected:
+                    if rule.passes_filters(node):
+                        logger.debug(f"Checking if {repr(node)} follows {repr(rule)}")
+                        follows, self.context = rule.followed_by(node, self.context)
+                        if not follows:
+                            violations.append(
+                                (
+                                    rule.code,
+                                    rule.title,
+                                    rule.rationale,
+                                    node.line_number,
+                                )
                             )
-                        )
-                # Set if node matches selectors even if it doesn't match filters
-                if rule.selects(self.lineage):
+                    # Set even if the node doesn't match the rule's filters
                     self.context.previous_node[rule.code] = node
 
-        if node.children:
-            for child in node.children:
-                child.accept(self)
+            children = node.children
+            if children:
+                # Reversed so popping preserves document order
+                for child in reversed(children):
+                    # Pairs are leaves of the walk, and so are lists unless
+                    # they hold pair items (e.g. filters: [field: "value"]),
+                    # which a rule can select through the list's lineage — so
+                    # if no rule's selector ends in a leaf child's type,
+                    # visiting it can't have any effect and the dispatch can
+                    # be skipped entirely
+                    if (
+                        child.__class__ is PairNode
+                        or (child.__class__ is ListNode and not child.children)
+                    ) and child.type.value not in rules_by_tail:
+                        continue
+                    stack.append(child)
+
+
+def check_tree(tree: DocumentNode, ruleset: tuple[Rule, ...]) -> list[tuple]:
+    """Validate an already-parsed LookML tree against a ruleset.
+
+    Callers that hold a parse tree (or want to lint one tree against several
+    rulesets) can use this directly and skip re-parsing the source text.
+    """
+    reset_param_cache()
+    visitor = StyleCheckVisitor(ruleset)
+    tree.accept(visitor)
+    return visitor.violations
+
+
+# Parse-level cache beneath the result cache: the same source checked under a
+# different ruleset (e.g. config experiments, one tree against several rule
+# subsets) reuses the tree instead of re-tokenizing. Trees are treated as
+# read-only throughout, so sharing them is safe. Kept tiny — trees are several
+# times the size of their source, the CLI never checks the same text twice,
+# and exact repeats are already served whole by the result cache above this.
+_parse = lru_cache(maxsize=8)(lkml.parse)
+
+
+@lru_cache(maxsize=None)
+def _selector_tails(ruleset: tuple[Rule, ...]) -> tuple[str, ...]:
+    """The distinct final selector components across a ruleset."""
+    return tuple(
+        {selector.rsplit(".", 1)[-1] for rule in ruleset for selector in rule.select}
+    )
+
+
+# Rules hash by identity, so the cache key is cheap and a ruleset tuple built
+# from the same Rule objects (e.g. ALL_RULES subsets) keys consistently.
+# Results are stored as tuples so a cached hit can't be mutated by one caller
+# and observed by the next. Bounded because the keys hold whole source texts.
+@lru_cache(maxsize=512)
+def _cached_check(text: str, ruleset: tuple[Rule, ...]) -> tuple[tuple, ...]:
+    # Parse first so malformed input still raises regardless of the ruleset
+    tree = _parse(text)
+    # A rule can only fire on a node whose type equals the final component of
+    # one of its selectors, and type tokens appear verbatim in the source —
+    # so if no selector tail occurs as a substring, walking the tree can't
+    # produce a violation. Substring hits that aren't real type tokens (e.g.
+    # "sql" inside "sql_table_name") just fall through to the full walk, so
+    # this screen is conservative.
+    if not any(tail in text for tail in _selector_tails(ruleset)):
+        return ()
+    return tuple(check_tree(tree, ruleset))
 
 
 def check(text: str, ruleset: tuple[Rule, ...]) -> list[tuple]:
     """Validate a LookML string, given a set of rule codes to select and/or ignore."""
-    visitor = StyleCheckVisitor(ruleset)
-    tree = lkml.parse(text)
-    tree.accept(visitor)
-    return visitor.violations
+    # Accept any iterable of rules; the cache needs a hashable key
+    if not isinstance(ruleset, tuple):
+        ruleset = tuple(ruleset)
+    return list(_cached_check(text, ruleset))
+
+
+check.cache_clear = _cached_check.cache_clear  # type: ignore[attr-defined]
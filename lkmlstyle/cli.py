@@ -3,6 +3,7 @@ import logging
 import pathlib
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from rich.markup import escape
 from rich.markdown import Markdown
 from rich.console import Console
@@ -48,6 +49,69 @@ def format_error(message: str, title: str = "Error") -> Panel:
     )
 
 
+# Ruleset used by worker processes, built once per worker by _init_worker.
+# Rule objects themselves aren't picklable (their filters and compiled
+# patterns don't round-trip), so workers rebuild the ruleset from the same
+# config and CLI arguments instead of receiving it over the wire.
+_worker_ruleset: tuple | None = None
+
+
+def _init_worker(select: tuple[str, ...], ignore: tuple[str, ...]) -> None:
+    global _worker_ruleset
+    config = parse_config() or Config()
+    config.override(select=select, ignore=ignore)
+    _worker_ruleset = config.refine(ruleset=ALL_RULES)
+
+
+def _check_file(path: pathlib.Path, ruleset=None) -> tuple[str, list[tuple]]:
+    """Read and check a single file. May run in a worker process."""
+    if ruleset is None:
+        ruleset = _worker_ruleset
+    with path.open("r") as file:
+        text = file.read()
+    return text, check(text, ruleset)
+
+
+def _print_violations(
+    args, path: pathlib.Path, violations: list[tuple], lines: list[str]
+) -> None:
+    for violation in violations:
+        code, title, rationale, line_number = violation
+        console.print(f"[{code}] [bold red]{title}[/bold red]")
+        console.print(f"{format_path(path)}:{line_number}")
+        if args.show_rationale:
+            console.rule(style="grey30")
+            console.print(
+                Markdown("**Rationale:** " + rationale),
+                width=80,
+                highlight=False,
+                style="grey50",
+            )
+        console.rule(style="grey30")
+
+        for i, n in enumerate(range(line_number - 1, line_number + 3)):
+            if n <= 0:
+                continue
+            elif n > len(lines):
+                break
+            # Don't print whitespace-only leading lines
+            elif i == 0 and lines[n - 1].strip() == "":
+                continue
+            elif n == line_number:
+                console.print(
+                    f" {n:<4} [red]>[/red]| {escape(lines[n - 1])}",
+                    highlight=False,
+                    no_wrap=True,
+                )
+            else:
+                console.print(
+                    f" [dim]{n:<4}[/dim]  | [dim]{lines[n - 1]}[/dim]",
+                    highlight=False,
+                    no_wrap=True,
+                )
+        console.print()
+
+
 def check_style(args) -> None:
     try:
         config = parse_config() or Config()
@@ -98,12 +162,27 @@ def check_style(args) -> None:
         else:
             paths.append(path)
 
-    for path in sorted(set(paths)):
+    paths = sorted(set(paths))
+
+    # Parsing and rule matching are CPU-bound, so when checking several files,
+    # spread them across worker processes. Results are consumed in path order
+    # so the rendered output is identical to a sequential run.
+    futures = None
+    if len(paths) > 1:
+        executor = ProcessPoolExecutor(
+            initializer=_init_worker,
+            initargs=(tuple(args.select), tuple(args.ignore)),
+        )
+        futures = [executor.submit(_check_file, path) for path in paths]
+
+    for index, path in enumerate(paths):
         violations = []
 
         try:
-            with path.open("r") as file:
-                text = file.read()
+            if futures:
+                text, file_violations = futures[index].result()
+            else:
+                text, file_violations = _check_file(path, ruleset)
         except FileNotFoundError:
             console.print(
                 format_error(
@@ -112,9 +191,6 @@ def check_style(args) -> None:
                 )
             )
             sys.exit(101)
-
-        try:
-            file_violations = check(text, ruleset)
         except SyntaxError as error:
             console.print(
                 format_error(
@@ -134,45 +210,25 @@ def check_style(args) -> None:
             sys.exit(101)
 
         violations.extend(file_violations)
+
+        if not violations:
+            continue
+
+        # Only needed to print context around violations, so don't pay the
+        # full-file allocation for clean files
         lines = text.split("\n")
+        failed = True
 
-        if violations:
-            failed = True
+        # Buffer the whole report for this file and write it in one call,
+        # rather than paying a terminal write per console.print
+        with console.capture() as capture:
             console.rule(path.name, style="#9999ff")
             console.print()
-        for violation in violations:
-            code, title, rationale, line_number = violation
-            console.print(f"[{code}] [bold red]{title}[/bold red]")
-            console.print(f"{format_path(path)}:{line_number}")
-            if args.show_rationale:
-                console.rule(style="grey30")
-                console.print(
-                    Markdown("**Rationale:** " + rationale),
-                    width=80,
-                    highlight=False,
-                    style="grey50",
-                )
-            console.rule(style="grey30")
+            _print_violations(args, path, violations, lines)
+        console.file.write(capture.get())
 
-            for i, n in enumerate(range(line_number - 1, line_number + 3)):
-                if n <= 0:
-                    continue
-                # Don't print whitespace-only leading lines
-                elif i == 0 and lines[n - 1].strip() == "":
-                    continue
-                elif n == line_number:
-                    console.print(
-                        f" {n:<4} [red]>[/red]| {escape(lines[n - 1])}",
-                        highlight=False,
-                        no_wrap=True,
-                    )
-                else:
-                    console.print(
-                        f" [dim]{n:<4}[/dim]  | [dim]{lines[n - 1]}[/dim]",
-                        highlight=False,
-                        no_wrap=True,
-                    )
-            console.print()
+    if futures:
+        executor.shutdown()
 
     if failed:
         sys.exit(100)
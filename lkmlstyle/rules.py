@@ -1,8 +1,10 @@
 import re
-from typing import Sequence
+import sys
+from types import MappingProxyType
+from typing import Callable, Mapping
 import dataclasses
 from dataclasses import dataclass, field
-from functools import partial
+from functools import lru_cache, partial
 from lkml.tree import SyntaxNode, PairNode, BlockNode
 from lkmlstyle.utils import (
     find_child_by_type,
@@ -13,6 +15,32 @@ from lkmlstyle.utils import (
 )
 from lkmlstyle.exceptions import InvalidRule
 
+try:  # RE2 matches in linear time, so prefer it when it's installed
+    import re2 as _re2
+except ImportError:  # pragma: no cover
+    _re2 = None
+
+
+# Many rules share the same regex (e.g. the snake case rules), so cache compilation
+# to share a single pattern across rule instances, including rules rebuilt from YAML
+@lru_cache(maxsize=None)
+def _compile_pattern(regex: str):
+    if _re2 is not None:
+        try:
+            return _re2.compile(regex)
+        except _re2.error:
+            # RE2 doesn't support some constructs (e.g. backreferences), which
+            # can appear in custom rules, so fall back to the standard library
+            pass
+    try:
+        # LookML identifiers are ASCII, so skip the Unicode tables for \w, \s,
+        # \b and case-insensitive matching
+        return re.compile(regex, re.ASCII)
+    except ValueError:
+        # A custom rule with an inline (?u) flag conflicts with re.ASCII
+        return re.compile(regex)
+
+
 funcs = {
     func.__name__: func
     for func in [
@@ -46,6 +74,23 @@ def deserialize_partial(f: dict) -> partial:
     return partial(func, **f)  # type: ignore[arg-type]
 
 
+# Many rules bind the same (parameter, value) arguments, so share one partial
+# per combination instead of allocating a fresh one per rule. These must stay
+# partials—serialize_partial reads .func.__name__ and .keywords to round-trip
+# rules through YAML, which a plain closure couldn't support. Keywords are only
+# included when set so serialized output matches handwritten partials.
+@lru_cache(maxsize=None)
+def has_param(
+    parameter_name: str, value: str | None = None, negative: bool = False
+) -> partial:
+    kwargs: dict = {"parameter_name": parameter_name}
+    if value is not None:
+        kwargs["value"] = value
+    if negative:
+        kwargs["negative"] = negative
+    return partial(block_has_valid_parameter, **kwargs)
+
+
 @dataclass
 class NodeContext:
     """State required to check for rule violations"""
@@ -54,7 +99,31 @@ class NodeContext:
     table_to_view: dict[str, str] = field(default_factory=dict)
 
 
-@dataclass(frozen=True, kw_only=True)
+def _compose_filters(
+    filters: tuple[partial[bool], ...]
+) -> Callable[[SyntaxNode], bool] | None:
+    """Collapse a filter tuple into a single callable, or None when empty.
+
+    Most rules have zero or one filter, so specializing here spares applies_to
+    a per-call all() over a generator for the common cases.
+    """
+    if not filters:
+        return None
+    if len(filters) == 1:
+        return filters[0]
+
+    def check(node: SyntaxNode, _filters=filters) -> bool:
+        for is_filter_valid in _filters:
+            if not is_filter_valid(node):
+                return False
+        return True
+
+    return check
+
+
+# eq=False keeps identity comparison/hashing; rules are singletons in the
+# dispatch tables and field-walking equality would touch every partial
+@dataclass(frozen=True, eq=False, kw_only=True, slots=True)
 class Rule:
     title: str
     code: str
@@ -62,18 +131,35 @@ class Rule:
     select: str | tuple[str, ...]
     filters: tuple[partial[bool], ...]
     filter_on: str | None = None
+    # Derived in __post_init__; declared as a field so it's given a slot
+    _check_filters: Callable | None = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
         # If `select` arg is a string, wrap it in a tuple
         if isinstance(self.select, str):
             # Why? https://docs.python.org/3/library/dataclasses.html#frozen-instances
             object.__setattr__(self, "select", (self.select,))
+        # Codes in source literals are interned by the compiler, but codes from
+        # YAML configs aren't; interning here makes dict/set lookups on codes
+        # (dispatch tables, choose_rules, previous_node) pointer comparisons
+        object.__setattr__(self, "code", sys.intern(self.code))
+        object.__setattr__(self, "_check_filters", _compose_filters(self.filters))
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}<{self.code}>"
 
-    def __dict__(self) -> dict:  # type: ignore[override]
+    def as_dict(self) -> dict:
         rule = dataclasses.asdict(self)
+        # Derived fields only exist so slotted instances can cache state
+        for derived in (
+            "pattern",
+            "_search",
+            "_check",
+            "_check_filters",
+            "_order_index",
+            "_followed",
+        ):
+            rule.pop(derived, None)
         rule["type"] = self.__class__.__name__
         rule["filters"] = [serialize_partial(partial) for partial in rule["filters"]]
         return rule
@@ -117,9 +203,10 @@ class Rule:
     def applies_to(self, node: SyntaxNode, lineage: str) -> bool:
         """Check a node against a rule's filters for relevance."""
         # At a minimum, the node's lineage must match the selection string
-        if not self.selects(lineage):
-            return False
+        return self.selects(lineage) and self.passes_filters(node)
 
+    def passes_filters(self, node: SyntaxNode) -> bool:
+        """Check an already-selected node against the rule's filters."""
         # The rule may specify a descendant to filter on, find this node
         if self.filter_on:
             descendant = find_descendant_by_lineage(node, lineage=self.filter_on)
@@ -130,7 +217,8 @@ class Rule:
         else:
             filter_node = node
 
-        return all(is_filter_valid(filter_node) for is_filter_valid in self.filters)
+        check_filters = self._check_filters
+        return check_filters is None or check_filters(filter_node)
 
     def followed_by(
         self, node: SyntaxNode, context: NodeContext
@@ -140,28 +228,200 @@ class Rule:
 
     def get_node_value(self, node: SyntaxNode) -> str | None:
         """Extract a value string from a node."""
-        if isinstance(node, PairNode):
-            return node.value.value
-        elif isinstance(node, BlockNode) and node.name:
-            return node.name.value
-        else:
+        # Dispatch on class identity instead of an isinstance chain; the lkml
+        # node classes have no subclasses
+        getter = _NODE_VALUE_GETTERS.get(node.__class__)
+        return getter(node) if getter else None
+
+
+# Value extractors keyed by node class for O(1) dispatch in get_node_value
+_NODE_VALUE_GETTERS: dict[type, Callable[[SyntaxNode], str | None]] = {
+    PairNode: lambda node: node.value.value,
+    BlockNode: lambda node: node.name.value if node.name else None,
+}
+
+
+def _as_literal(fragment: str) -> str | None:
+    """Return the exact string a regex fragment matches, or None if it isn't literal."""
+    literal = []
+    index = 0
+    while index < len(fragment):
+        char = fragment[index]
+        if char == "\\" and index + 1 < len(fragment):
+            escaped = fragment[index + 1]
+            # Escaped metacharacters (\$, \{, \*) are literal; escape sequences
+            # like \d or \s are not
+            if escaped.isalnum():
+                return None
+            literal.append(escaped)
+            index += 2
+            continue
+        if char in ".^$*+?{}[]()|\\":
             return None
+        literal.append(char)
+        index += 1
+    return "".join(literal)
 
 
-@dataclass(frozen=True, repr=False)
+def _literal_alternatives(body: str) -> tuple[str, ...] | None:
+    """Expand a regex body into the literal strings it can match, or None.
+
+    Handles plain literals and at most one (?:a|b|...) alternation of literals,
+    which covers the shapes the default rules use.
+    """
+    group = re.fullmatch(r"(.*)\(\?:([^()]*)\)(.*)", body)
+    if group:
+        head, alternation, tail = group.groups()
+        options = alternation.split("|")
+    else:
+        head, options, tail = body, [""], ""
+
+    prefix = _as_literal(head)
+    suffix = _as_literal(tail)
+    if prefix is None or suffix is None:
+        return None
+
+    literals = []
+    for option in options:
+        literal = _as_literal(option)
+        if literal is None:
+            return None
+        literals.append(prefix + literal + suffix)
+    return tuple(literals)
+
+
+def _literal_matcher(regex: str) -> Callable[[str], bool] | None:
+    """Build a plain-string equivalent for a simple literal regex, if possible.
+
+    Most default rules are literal prefix/suffix/containment checks (^count_,
+    _date$, \\$\\{TABLE\\}). For those shapes, str.startswith, str.endswith,
+    equality, and `in` are single C-level calls—much cheaper than entering the
+    regex engine—so detect them and bypass the compiled pattern entirely.
+    """
+    anchored_start = regex.startswith("^")
+    anchored_end = regex.endswith("$") and not regex.endswith(r"\$")
+    body = regex[1 if anchored_start else 0 : -1 if anchored_end else None]
+
+    literals = _literal_alternatives(body)
+    if not literals:
+        return None
+
+    if anchored_start and anchored_end:
+        if len(literals) == 1:
+            return literals[0].__eq__
+        return frozenset(literals).__contains__
+    if anchored_start:
+        return lambda value, _prefixes=literals: value.startswith(_prefixes)
+    if anchored_end:
+        return lambda value, _suffixes=literals: value.endswith(_suffixes)
+    if len(literals) == 1:
+        return lambda value, _literal=literals[0]: _literal in value
+    # An unanchored alternation would need a search per option; leave it to the
+    # regex engine
+    return None
+
+
+def _expand_char_class(body: str) -> frozenset[str] | None:
+    """Expand a character-class body like "_a-z0-9" into its member characters."""
+    if body.startswith("^"):
+        # Negated classes fall back to the engine
+        return None
+    chars: set[str] = set()
+    index = 0
+    while index < len(body):
+        char = body[index]
+        if char == "\\" and index + 1 < len(body):
+            escaped = body[index + 1]
+            if escaped.isalnum():
+                return None
+            chars.add(escaped)
+            index += 2
+            continue
+        if index + 2 < len(body) and body[index + 1] == "-":
+            start, end = ord(char), ord(body[index + 2])
+            if start > end:
+                return None
+            chars.update(map(chr, range(start, end + 1)))
+            index += 3
+            continue
+        chars.add(char)
+        index += 1
+    return frozenset(chars)
+
+
+# ^[...]+$ with an optional \+? prefix, the shape of the snake case rules
+_CHARSET_SHAPE = re.compile(r"\^(\\\+\?)?\[([^\]]*)\]\+\$\Z")
+
+
+def _charset_matcher(regex: str) -> Callable[[str], bool] | None:
+    """Build a set-membership equivalent for anchored character-class regexes.
+
+    ^[_a-z0-9]+$ only asks "is the string non-empty and every character in
+    this set?", which frozenset.issuperset answers in a single C call.
+    """
+    shape = _CHARSET_SHAPE.match(regex)
+    if shape is None:
+        return None
+    optional_plus, body = shape.groups()
+    allowed = _expand_char_class(body)
+    if allowed is None:
+        return None
+    issuperset = allowed.issuperset
+    if optional_plus:
+
+        def matcher(value: str) -> bool:
+            if value.startswith("+"):
+                value = value[1:]
+            return bool(value) and issuperset(value)
+
+        return matcher
+    return lambda value, _issuperset=issuperset: bool(value) and _issuperset(value)
+
+
+@dataclass(frozen=True, eq=False, repr=False, slots=True)
 class PatternMatchRule(Rule):
     regex: str
     negative: bool | None = False
+    # Derived in __post_init__; declared as fields so they're given slots
+    pattern: re.Pattern = field(init=False, repr=False, compare=False)
+    _search: Callable = field(init=False, repr=False, compare=False)
+    _check: Callable[[str], bool] = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
-        super().__post_init__()
+        # Zero-argument super() doesn't survive the class recreation that
+        # slots=True performs, so name the base class explicitly
+        Rule.__post_init__(self)
         # Why? https://docs.python.org/3/library/dataclasses.html#frozen-instances
-        object.__setattr__(self, "pattern", re.compile(self.regex))
+        pattern = _compile_pattern(self.regex)
+        object.__setattr__(self, "pattern", pattern)
+        # Bind the scan method so the hot path skips an attribute lookup.
+        # A start-anchored pattern can only ever match at position zero, so
+        # use match, which skips search's scan across start positions
+        scan = pattern.match if self.regex.startswith("^") else pattern.search
+        # Literal- and charset-shaped regexes get a plain-string matcher
+        # instead of the regex engine; both are truthy on a match, falsy
+        # otherwise
+        literal = _literal_matcher(self.regex) or _charset_matcher(self.regex)
+        object.__setattr__(self, "_search", literal or scan)
+        object.__setattr__(self, "negative", bool(self.negative))
+        # negative is fixed per rule, so fold it in here rather than
+        # branching on it for every value checked. Literal matchers already
+        # return a bool, so the positive path uses them bare; regex scans
+        # return a Match or None, tested with `is` instead of a bool() call
+        if literal is not None:
+            if self.negative:
+                check = lambda string, _match=literal: not _match(string)  # noqa: E731
+            else:
+                check = literal
+        elif self.negative:
+            check = lambda string, _scan=scan: _scan(string) is None  # noqa: E731
+        else:
+            check = lambda string, _scan=scan: _scan(string) is not None  # noqa: E731
+        object.__setattr__(self, "_check", check)
 
     def _matches(self, string: str) -> bool:
         """Check a string against the rule's regex."""
-        matched = bool(self.pattern.search(string))  # type: ignore[attr-defined]
-        return not matched if self.negative else matched
+        return self._check(string)
 
     def followed_by(
         self, node: SyntaxNode, context: NodeContext
@@ -173,13 +433,25 @@ class PatternMatchRule(Rule):
         return self._matches(value), context
 
 
-@dataclass(frozen=True, repr=False)
+@dataclass(frozen=True, eq=False, repr=False, slots=True)
 class ParameterRule(Rule):
     criteria: partial[bool]
     negative: bool | None = False
+    # Derived in __post_init__; declared as a field so it's given a slot
+    _check: Callable[[SyntaxNode], bool] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        Rule.__post_init__(self)
+        # As in PatternMatchRule, fold the fixed negative flag into one callable
+        criteria = self.criteria
+        if self.negative:
+            check = lambda node, _criteria=criteria: not _criteria(node)  # noqa: E731
+        else:
+            check = criteria
+        object.__setattr__(self, "_check", check)
 
-    def __dict__(self) -> dict:  # type: ignore[override]
-        rule = super().__dict__()
+    def as_dict(self) -> dict:
+        rule = Rule.as_dict(self)
         rule["criteria"] = serialize_partial(self.criteria)
         return rule
 
@@ -196,31 +468,59 @@ class ParameterRule(Rule):
         self, node: SyntaxNode, context: NodeContext
     ) -> tuple[bool, NodeContext]:
         """Determine if node follows the rule."""
-        matched = self.criteria(node)
-        return not matched if self.negative else matched, context
+        return self._check(node), context
 
 
-@dataclass(frozen=True, repr=False)
+@dataclass(frozen=True, eq=False, repr=False, slots=True)
 class OrderRule(Rule):
     alphabetical: bool = False
     is_first: bool = False
     use_key: bool = True
-    order: Sequence[str] | None = None
+    order: tuple[str, ...] | None = None
+    # Derived in __post_init__; declared as fields so they're given slots
+    _order_index: Mapping[str, int] | None = field(
+        init=False, repr=False, compare=False
+    )
+    _followed: Callable = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
-        super().__post_init__()
+        Rule.__post_init__(self)
         # Ensure the argument combination makes sense
         if (self.alphabetical + self.is_first + bool(self.order)) > 1:
             raise ValueError(
                 "Only one of 'alphabetical', 'is_first', or 'order' can be defined as "
                 "the sort order"
             )
+        # Orders loaded from YAML arrive as lists
+        if self.order is not None and not isinstance(self.order, tuple):
+            object.__setattr__(self, "order", tuple(self.order))
+        # Precompute each value's position so followed_by compares indexes
+        # instead of rebuilding sets per node
+        object.__setattr__(
+            self,
+            "_order_index",
+            {value: index for index, value in enumerate(self.order)}
+            if self.order
+            else None,
+        )
+        # The sort mode is fixed per rule, so bind its handler once instead
+        # of re-testing alphabetical/is_first/order on every node
+        if self.alphabetical:
+            followed = self._follows_alphabetical
+        elif self.is_first:
+            followed = self._follows_is_first
+        elif self.order:
+            followed = self._follows_order
+        else:
+            followed = self._follows_unset
+        object.__setattr__(self, "_followed", followed)
 
     def get_node_value(self, node: SyntaxNode) -> str | None:
         """Extract a value string from a node."""
-        if isinstance(node, PairNode):
+        cls = node.__class__
+        if cls is PairNode:
             return node.type.value if self.use_key else node.value.value
-        elif isinstance(node, BlockNode) and node.name:
+        elif cls is BlockNode and node.name:
             return node.name.value
         else:
             return None
@@ -229,34 +529,37 @@ class OrderRule(Rule):
         self, node: SyntaxNode, context: NodeContext
     ) -> tuple[bool, NodeContext]:
         """Determine if node follows the rule."""
-        follows = True
-        prev = context.previous_node.get(self.code)
-
-        if self.alphabetical:
-            if prev:
-                node_value = self.get_node_value(node)
-                prev_value = self.get_node_value(prev)
-                if node_value and prev_value:
-                    follows = node_value > prev_value
-                else:
-                    raise TypeError("Value of a compared node is None")
-            else:
-                follows = True
-        elif self.is_first:
-            follows = prev is None
-        elif self.order:
-            if prev:
-                subset = set((self.get_node_value(prev), self.get_node_value(node)))
-                follows = subset in set(self.order)
-            else:
-                follows = self.get_node_value(node) == self.order[0]
-        else:
-            raise AttributeError("Alphabetical, is_first, or custom order must be set")
-
-        return follows, context
-
-
-@dataclass(frozen=True, repr=False)
+        return self._followed(node, context.previous_node.get(self.code)), context
+
+    def _follows_alphabetical(self, node: SyntaxNode, prev: SyntaxNode | None) -> bool:
+        if not prev:
+            return True
+        node_value = self.get_node_value(node)
+        prev_value = self.get_node_value(prev)
+        if node_value and prev_value:
+            return node_value > prev_value
+        raise TypeError("Value of a compared node is None")
+
+    def _follows_is_first(self, node: SyntaxNode, prev: SyntaxNode | None) -> bool:
+        return prev is None
+
+    def _follows_order(self, node: SyntaxNode, prev: SyntaxNode | None) -> bool:
+        order_index = self._order_index
+        if prev:
+            # Values outside the ordering sort after everything in it, on
+            # both sides — an ordered value regressing past an unknown one
+            # is a violation too
+            unknown = len(order_index)
+            position = order_index.get(self.get_node_value(node), unknown)
+            previous = order_index.get(self.get_node_value(prev), unknown)
+            return position >= previous
+        return self.get_node_value(node) == self.order[0]
+
+    def _follows_unset(self, node: SyntaxNode, prev: SyntaxNode | None) -> bool:
+        raise AttributeError("Alphabetical, is_first, or custom order must be set")
+
+
+@dataclass(frozen=True, eq=False, repr=False, slots=True)
 class DuplicateViewRule(Rule):
     def followed_by(
         self, node: SyntaxNode, context: NodeContext
@@ -265,30 +568,26 @@ class DuplicateViewRule(Rule):
         if not isinstance(node, BlockNode):
             return True, context
 
-        if context.table_to_view is None:
-            raise TypeError("table_to_view cannot be None")
-
-        if node.name is None:
-            raise TypeError(f"Name for view {repr(node)} is None")
-
-        view_name: str = node.name.value
+        # Most views pass, so find sql_table_name first and defer everything
+        # else until there's something to record
         sql_table_name_node = find_child_by_type(node, "sql_table_name")
-
         if sql_table_name_node is None:
             return True, context
-        elif not isinstance(sql_table_name_node, PairNode):
+        if not isinstance(sql_table_name_node, PairNode):
             raise TypeError(
                 "Node for sql_table_name is of unexpected type "
                 f"{type(sql_table_name_node)}. Expected a PairNode"
             )
-        else:
-            sql_table_name = sql_table_name_node.value.value
+        sql_table_name = sql_table_name_node.value.value
 
-        if sql_table_name in context.table_to_view:
+        table_to_view = context.table_to_view
+        if sql_table_name in table_to_view:
             return False, context
-        else:
-            context.table_to_view[sql_table_name] = view_name
-            return True, context
+
+        if node.name is None:
+            raise TypeError(f"Name for view {repr(node)} is None")
+        table_to_view[sql_table_name] = node.name.value
+        return True, context
 
 
 # Rules define the criteria for the passing state
@@ -341,7 +640,7 @@ ALL_RULES = (
         ),
         select="measure",
         filters=(
-            partial(block_has_valid_parameter, parameter_name="type", value="count"),
+            has_param("type", value="count"),
         ),
         regex=r"^count_",
     ),
@@ -355,7 +654,7 @@ ALL_RULES = (
         ),
         select="measure",
         filters=(
-            partial(block_has_valid_parameter, parameter_name="type", value="sum"),
+            has_param("type", value="sum"),
         ),
         regex=r"^total_",
     ),
@@ -369,7 +668,7 @@ ALL_RULES = (
         ),
         select="measure",
         filters=(
-            partial(block_has_valid_parameter, parameter_name="type", value="average"),
+            has_param("type", value="average"),
         ),
         regex=r"^(?:avg|average)_",
     ),
@@ -382,7 +681,7 @@ ALL_RULES = (
         ),
         select="dimension",
         filters=(
-            partial(block_has_valid_parameter, parameter_name="type", value="yesno"),
+            has_param("type", value="yesno"),
         ),
         regex=r"^(?:is|has)_",
     ),
@@ -458,7 +757,7 @@ ALL_RULES = (
         ),
         select="explore",
         filters=tuple(),
-        criteria=partial(block_has_valid_parameter, parameter_name="fields"),
+        criteria=has_param("fields"),
     ),
     ParameterRule(
         title="Visible dimension missing description",
@@ -470,15 +769,10 @@ ALL_RULES = (
         select=("dimension", "dimension_group"),
         filters=tuple(
             [
-                partial(
-                    block_has_valid_parameter,
-                    parameter_name="hidden",
-                    value="yes",
-                    negative=True,
-                )
+                has_param("hidden", value="yes", negative=True)
             ],
         ),
-        criteria=partial(block_has_valid_parameter, parameter_name="description"),
+        criteria=has_param("description"),
     ),
     ParameterRule(
         title="Visible measure missing description",
@@ -490,15 +784,10 @@ ALL_RULES = (
         select="measure",
         filters=tuple(
             [
-                partial(
-                    block_has_valid_parameter,
-                    parameter_name="hidden",
-                    value="yes",
-                    negative=True,
-                )
+                has_param("hidden", value="yes", negative=True)
             ],
         ),
-        criteria=partial(block_has_valid_parameter, parameter_name="description"),
+        criteria=has_param("description"),
     ),
     ParameterRule(
         title="View must define at least one primary key dimension",
@@ -547,16 +836,10 @@ ALL_RULES = (
         select="dimension",
         filters=tuple(
             [
-                partial(
-                    block_has_valid_parameter, parameter_name="primary_key", value="yes"
-                )
+                has_param("primary_key", value="yes")
             ],
         ),
-        criteria=partial(
-            block_has_valid_parameter,
-            parameter_name="hidden",
-            value="yes",
-        ),
+        criteria=has_param("hidden", value="yes"),
     ),
     ParameterRule(
         title="Count measure doesn't specify a filter",
@@ -578,9 +861,9 @@ ALL_RULES = (
         ),
         select="measure",
         filters=tuple(
-            [partial(block_has_valid_parameter, parameter_name="type", value="count")],
+            [has_param("type", value="count")],
         ),
-        criteria=partial(block_has_valid_parameter, parameter_name="filters"),
+        criteria=has_param("filters"),
     ),
     OrderRule(
         title="Dimension not in alphabetical order",
@@ -618,9 +901,7 @@ ALL_RULES = (
         select="dimension",
         filters=tuple(
             [
-                partial(
-                    block_has_valid_parameter, parameter_name="primary_key", value="yes"
-                )
+                has_param("primary_key", value="yes")
             ]
         ),
         is_first=True,
@@ -687,9 +968,21 @@ ALL_RULES = (
     ),
 )
 
-RULES_BY_CODE: dict[str, Rule] = {}
+_rules_by_code: dict[str, Rule] = {}
 for rule in ALL_RULES:
-    if rule.code in RULES_BY_CODE:
+    if rule.code in _rules_by_code:
         raise KeyError(f"A rule with code {rule.code} already exists")
     else:
-        RULES_BY_CODE[rule.code] = rule
+        _rules_by_code[rule.code] = rule
+
+# Read-only views so hot-path readers can't accidentally mutate the defaults
+RULES_BY_CODE: Mapping[str, Rule] = MappingProxyType(_rules_by_code)
+
+_rules_by_select: dict[str, list[Rule]] = {}
+for rule in ALL_RULES:
+    for selector in rule.select:
+        _rules_by_select.setdefault(selector, []).append(rule)
+
+RULES_BY_SELECT: Mapping[str, tuple[Rule, ...]] = MappingProxyType(
+    {selector: tuple(rules) for selector, rules in _rules_by_select.items()}
+)
@@ -1,7 +1,14 @@
 from typing import Protocol, runtime_checkable
-from lkml.tree import SyntaxToken
+from lkml.tree import BlockNode, ListNode, PairNode, SyntaxToken
 
 
 @runtime_checkable
 class HasType(Protocol):
     type: SyntaxToken
+
+
+# The concrete node classes that carry a type token. An isinstance against
+# this tuple is a C-level class check, where the runtime-checkable Protocol
+# above probes the attribute dynamically on every call — keep the Protocol
+# for annotations and use the tuple in hot paths.
+TYPED_NODE_CLASSES: tuple[type, ...] = (BlockNode, PairNode, ListNode)
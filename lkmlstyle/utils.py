@@ -1,12 +1,19 @@
+import sys
 from functools import partial
-from typing import Callable
-from lkml.tree import SyntaxNode, PairNode, BlockNode
-from lkmlstyle.types import HasType
+from typing import Callable, NamedTuple
+from lkml.tree import SyntaxNode, PairNode, BlockNode, ContainerNode
+from lkmlstyle.types import HasType, TYPED_NODE_CLASSES
 
 
 def find_child_by_type(node: SyntaxNode, node_type: str) -> SyntaxNode | None:
+    # Blocks answer from their cached child index instead of a linear scan;
+    # repeated lookups against the same block (rule filters, duplicate-view
+    # tracking) become dict hits
+    if node.__class__ is BlockNode:
+        children = index_block(node).nodes.get(node_type)
+        return children[0] if children else None
     for child in node.children or []:
-        if isinstance(child, HasType) and child.type.value == node_type:
+        if isinstance(child, TYPED_NODE_CLASSES) and child.type.value == node_type:
             return child
     return None
 
@@ -38,14 +45,83 @@ def pair_has_valid_value(pair: PairNode, value: str) -> bool:
 def node_has_at_least_one_valid_child(
     node: SyntaxNode, is_valid: Callable[..., bool]
 ) -> bool:
-    if node.children is None:
-        return False
-    for child in node.children or []:
-        if is_valid(child):
-            return True
+    stack = [node]
+    while stack:
+        children = stack.pop().children
+        if not children:
+            continue
+        for child in children:
+            # Containers are transparent wrappers, so look through them.
+            # Class identity is cheaper than isinstance and ContainerNode has
+            # no subclasses in the lkml tree
+            if child.__class__ is ContainerNode:
+                stack.append(child)
+            elif is_valid(child):
+                return True
     return False
 
 
+# Memoized results for block_has_valid_parameter. Many rules ask the same
+# question of the same block (e.g. "does this measure have type: count?"), so
+# cache per block for the duration of a lint pass. Each entry keeps a reference
+# to its block so an id can't be recycled while the entry is alive.
+_param_cache: dict[tuple, tuple[BlockNode, bool]] = {}
+
+# Per-block child indexes, built lazily by index_block and keyed like
+# _param_cache so block ids can't be recycled while an entry is alive
+_block_index_cache: dict[int, tuple[BlockNode, "BlockIndex"]] = {}
+
+
+def reset_param_cache() -> None:
+    """Clear memoized parameter lookups, e.g. between lint passes."""
+    _param_cache.clear()
+    _block_index_cache.clear()
+
+
+class BlockIndex(NamedTuple):
+    """A block's typed children grouped by parameter name."""
+
+    nodes: dict[str, list[SyntaxNode]]
+    pairs: dict[str, list[PairNode]]
+
+
+def index_block(block: BlockNode) -> BlockIndex:
+    """Group a block's direct children by type, building the index only once.
+
+    Rules repeatedly ask whether a block defines some parameter; answering
+    from this index is a dict lookup instead of a fresh walk over the block's
+    children for every rule.
+    """
+    cached = _block_index_cache.get(id(block))
+    if cached is not None:
+        return cached[1]
+
+    nodes: dict[str, list[SyntaxNode]] = {}
+    pairs: dict[str, list[PairNode]] = {}
+    stack: list = [block]
+    while stack:
+        children = stack.pop().children
+        if not children:
+            continue
+        for child in children:
+            if child.__class__ is ContainerNode:
+                stack.append(child)
+                continue
+            type_token = getattr(child, "type", None)
+            if type_token is None:
+                continue
+            # Interned so lookups against parameter-name literals (which the
+            # compiler interns) hit the pointer-equality fast path
+            node_type = sys.intern(type_token.value)
+            nodes.setdefault(node_type, []).append(child)
+            if child.__class__ is PairNode:
+                pairs.setdefault(node_type, []).append(child)
+
+    index = BlockIndex(nodes, pairs)
+    _block_index_cache[id(block)] = (block, index)
+    return index
+
+
 def block_has_valid_parameter(
     block: BlockNode,
     parameter_name: str,
@@ -56,24 +132,23 @@ def block_has_valid_parameter(
     if not isinstance(block, BlockNode):
         return False
 
-    def is_valid_param(node: HasType) -> bool:
-        # Only consider nodes that define a type attribute
-        if not isinstance(node, HasType):
-            return False
-        if not node_has_valid_type(node, parameter_name):
-            return False
-
-        if value:
-            # Can only test value for PairNodes
-            if not isinstance(node, PairNode):
-                return False
-            if not pair_has_valid_value(node, value):
-                return False
-
-        return True
-
-    valid = node_has_at_least_one_valid_child(block, is_valid_param)
-    return not valid if negative else valid
+    key = (id(block), parameter_name, value, negative)
+    cached = _param_cache.get(key)
+    if cached is not None:
+        return cached[1]
+
+    index = index_block(block)
+    if value is None:
+        # With no value to test, any typed child counts, pair or block
+        valid = parameter_name in index.nodes
+    else:
+        # Values can only be tested against pairs
+        valid = any(
+            pair.value.value == value for pair in index.pairs.get(parameter_name, ())
+        )
+    result = not valid if negative else valid
+    _param_cache[key] = (block, result)
+    return result
 
 
 def block_has_any_valid_parameter(block: BlockNode, parameters: dict) -> bool:
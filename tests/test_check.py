@@ -1,26 +1,30 @@
 from dataclasses import replace
 from pathlib import Path
+from types import MappingProxyType
 import pytest
 import yaml
-from lkmlstyle.check import choose_rules, resolve_overrides, Config
+from lkmlstyle.check import check, choose_rules, resolve_overrides, Config
 from lkmlstyle.rules import Rule, RULES_BY_CODE
 from lkmlstyle.exceptions import InvalidConfig, InvalidRule
 
+# Built once at import; the proxy keeps tests from mutating the shared subset
+SUBSET_CODES = ("M106", "D100", "M110", "V100")
+RULES_SUBSET = MappingProxyType({code: RULES_BY_CODE[code] for code in SUBSET_CODES})
+RULESET = tuple(RULES_SUBSET.values())
+
 
 @pytest.fixture
 def rules_by_code():
-    return {
-        k: v for k, v in RULES_BY_CODE.items() if k in ("M106", "D100", "M110", "V100")
-    }
+    return RULES_SUBSET
 
 
 @pytest.fixture
-def ruleset(rules_by_code):
-    return tuple(rules_by_code.values())
+def ruleset():
+    return RULESET
 
 
-def rules_to_codes(rules: tuple[Rule]) -> tuple[str, ...]:
-    return tuple(rule.code for rule in rules)
+def rules_to_codes(rules: tuple[Rule]) -> frozenset[str]:
+    return frozenset(rule.code for rule in rules)
 
 
 @pytest.fixture
@@ -227,3 +231,15 @@ def test_config_refine_should_work(ruleset, custom_rule):
     config = Config(custom_rules=(custom_rule,))
     refined = config.refine(ruleset)
     assert custom_rule in refined
+
+
+def test_rules_can_select_pairs_inside_lists(rules_by_code):
+    # Pair items inside a list (e.g. filters) must still be visited even when
+    # nothing selects the list itself
+    rule = replace(
+        rules_by_code["V100"], code="X100", select="measure.filters.created_date"
+    )
+    fails = 'measure: m { filters: [created_date: "7 days"] }'
+    passes = 'measure: m { filters: [created_date: "last_week"] }'
+    assert check(fails, (rule,))
+    assert not check(passes, (rule,))
@@ -1,7 +1,14 @@
+from functools import cache
+
+import pytest
+
 import lkmlstyle
-from lkmlstyle.rules import Rule, RULES_BY_CODE
+from lkmlstyle.rules import OrderRule, Rule, RULES_BY_CODE
 
 
+# Cached: each test asks for the same code at least twice (fails and passes),
+# and reusing the tuple also keys the checker's result cache consistently
+@cache
 def get_rule_by_code(code: str) -> tuple[Rule]:
     return (RULES_BY_CODE[code],)
 
@@ -90,10 +97,15 @@ def test_measures_only_reference_dimensions():
 
 def test_redundant_dimension_type():
     fails = "dimension: order_id { type: string }"
-    all_passes = ["dimension: order_id { }", "dimension: order_id { type: number }"]
     assert lkmlstyle.check(fails, ruleset=get_rule_by_code("D300"))
-    for passes in all_passes:
-        assert not lkmlstyle.check(passes, ruleset=get_rule_by_code("D300"))
+
+
+@pytest.mark.parametrize(
+    "passes",
+    ["dimension: order_id { }", "dimension: order_id { type: number }"],
+)
+def test_redundant_dimension_type_passes(passes):
+    assert not lkmlstyle.check(passes, ruleset=get_rule_by_code("D300"))
 
 
 def test_explore_must_declare_fields():
@@ -103,16 +115,24 @@ def test_explore_must_declare_fields():
     assert not lkmlstyle.check(passes, ruleset=get_rule_by_code("E100"))
 
 
-def test_visible_dimensions_without_descriptions():
-    all_fails = [
+@pytest.mark.parametrize(
+    "fails",
+    [
         """dimension: order_id {
             type: number
         }""",
         """dimension: order_id {
             hidden: no
         }""",
-    ]
-    all_passes = [
+    ],
+)
+def test_visible_dimensions_without_descriptions_fails(fails):
+    assert lkmlstyle.check(fails, ruleset=get_rule_by_code("D301"))
+
+
+@pytest.mark.parametrize(
+    "passes",
+    [
         """dimension: order_id {
             hidden: yes
             type: number
@@ -124,15 +144,15 @@ def test_visible_dimensions_without_descriptions():
         """dimension: order_id {
             description: "Unique identifier for each order"
         }""",
-    ]
-    for fails in all_fails:
-        assert lkmlstyle.check(fails, ruleset=get_rule_by_code("D301"))
-    for passes in all_passes:
-        assert not lkmlstyle.check(passes, ruleset=get_rule_by_code("D301"))
+    ],
+)
+def test_visible_dimensions_without_descriptions_passes(passes):
+    assert not lkmlstyle.check(passes, ruleset=get_rule_by_code("D301"))
 
 
-def test_view_defines_at_least_one_primary_key():
-    all_fails = (
+@pytest.mark.parametrize(
+    "fails",
+    [
         """
         view: orders {
             sql_table_name: `analytics.orders` ;;
@@ -150,7 +170,13 @@ def test_view_defines_at_least_one_primary_key():
             }
         }
         """,
-    )
+    ],
+)
+def test_view_defines_at_least_one_primary_key_fails(fails):
+    assert lkmlstyle.check(fails, ruleset=get_rule_by_code("V110"))
+
+
+def test_view_defines_at_least_one_primary_key():
     passes = """
     view: orders {
         sql_table_name: `analytics.orders` ;;
@@ -160,13 +186,12 @@ def test_view_defines_at_least_one_primary_key():
         }
     }
     """
-    for fails in all_fails:
-        assert lkmlstyle.check(fails, ruleset=get_rule_by_code("V110"))
     assert not lkmlstyle.check(passes, ruleset=get_rule_by_code("V110"))
 
 
-def test_primary_key_dimension_hidden():
-    all_fails = (
+@pytest.mark.parametrize(
+    "fails",
+    [
         """
         dimension: order_id {
             primary_key: yes
@@ -178,15 +203,19 @@ def test_primary_key_dimension_hidden():
             hidden: no
         }
         """,
-    )
+    ],
+)
+def test_primary_key_dimension_hidden_fails(fails):
+    assert lkmlstyle.check(fails, ruleset=get_rule_by_code("D302"))
+
+
+def test_primary_key_dimension_hidden():
     passes = """
     dimension: order_id {
         primary_key: yes
         hidden: yes
     }
     """
-    for fails in all_fails:
-        assert lkmlstyle.check(fails, ruleset=get_rule_by_code("D302"))
     assert not lkmlstyle.check(passes, ruleset=get_rule_by_code("D302"))
 
 
@@ -264,6 +293,77 @@ def test_primary_key_dimension_should_be_first():
     assert not lkmlstyle.check(passes, ruleset=get_rule_by_code("D107"))
 
 
+# No default rule sets order=, but custom rules from configs can
+CUSTOM_ORDER_RULESET = (
+    OrderRule(
+        title="Dimensions are not in the expected order",
+        code="X106",
+        rationale="Pins a fixed ordering of dimension names.",
+        select="dimension",
+        filters=(),
+        order=("created", "updated", "deleted"),
+    ),
+)
+
+
+@pytest.mark.parametrize(
+    "passes",
+    [
+        # The full ordering
+        """
+        dimension: created {}
+        dimension: updated {}
+        dimension: deleted {}
+        """,
+        # Repeated values are allowed
+        """
+        dimension: created {}
+        dimension: created {}
+        dimension: updated {}
+        """,
+        # Values outside the ordering sort after everything in it
+        """
+        dimension: created {}
+        dimension: deleted {}
+        dimension: zzz {}
+        """,
+    ],
+)
+def test_custom_order_passes(passes):
+    assert not lkmlstyle.check(passes, ruleset=CUSTOM_ORDER_RULESET)
+
+
+@pytest.mark.parametrize(
+    "fails",
+    [
+        # Must start with the first value of the ordering
+        """
+        dimension: updated {}
+        dimension: deleted {}
+        """,
+        # Ordered values can't regress
+        """
+        dimension: created {}
+        dimension: deleted {}
+        dimension: updated {}
+        """,
+        # A value outside the ordering can't come first either
+        """
+        dimension: zzz {}
+        dimension: created {}
+        """,
+        # Ordered values can't regress past an unknown value, which sorts last
+        """
+        dimension: created {}
+        dimension: zzz {}
+        dimension: updated {}
+        """,
+    ],
+)
+def test_custom_order_fails(fails):
+    assert lkmlstyle.check(fails, ruleset=CUSTOM_ORDER_RULESET)
+
+
 def test_views_should_not_have_the_same_sql_table_name():
     passes = """
     view: abc {
@@ -1,4 +1,7 @@
+from functools import lru_cache
+
 import lkml
+import pytest
 from lkml.tree import PairNode, BlockNode
 from lkmlstyle.utils import (
     block_has_valid_parameter,
@@ -6,7 +9,9 @@ from lkmlstyle.utils import (
     find_descendant_by_lineage,
 )
 
-# Strip away the DocumentNode and its container
+# Strip away the DocumentNode and its container. Cached so snippets shared
+# between tests (which only read the nodes) are parsed once per session.
+@lru_cache(maxsize=None)
 def parse(text: str):
     return lkml.parse(text).container.items
 
@@ -64,32 +69,35 @@ def test_find_descendant_by_lineage_should_work():
     assert not match
 
 
-def test_block_has_valid_parameter_should_work():
-    # Not a block node
+def test_block_has_valid_parameter_should_reject_non_blocks():
     nodes = parse("hidden: yes")
     assert not block_has_valid_parameter(nodes[0], parameter_name="hidden")
 
-    # Parameter only
-    nodes = parse("dimension: { hidden: yes primary_key: yes }")
-    assert block_has_valid_parameter(nodes[0], parameter_name="primary_key")
-    assert not block_has_valid_parameter(nodes[0], parameter_name="view_label")
 
-    # Parameter and value
-    assert block_has_valid_parameter(
-        nodes[0], parameter_name="primary_key", value="yes"
-    )
-    assert not block_has_valid_parameter(
-        nodes[0], parameter_name="primary_key", value="no"
+@pytest.mark.parametrize(
+    "parameter_name,value,negative,expected",
+    [
+        # Parameter only
+        ("primary_key", None, False, True),
+        ("view_label", None, False, False),
+        # Parameter and value
+        ("primary_key", "yes", False, True),
+        ("primary_key", "no", False, False),
+        # Negative works
+        ("primary_key", "no", True, True),
+        ("primary_key", "yes", True, False),
+    ],
+)
+def test_block_has_valid_parameter_should_work(parameter_name, value, negative, expected):
+    nodes = parse("dimension: { hidden: yes primary_key: yes }")
+    assert (
+        block_has_valid_parameter(
+            nodes[0], parameter_name=parameter_name, value=value, negative=negative
+        )
+        is expected
     )
 
-    # Negative works
-    assert block_has_valid_parameter(
-        nodes[0], parameter_name="primary_key", value="no", negative=True
-    )
-    assert not block_has_valid_parameter(
-        nodes[0], parameter_name="primary_key", value="yes", negative=True
-    )
 
-    # Paramter and value, but child is not a PairNode
+def test_block_has_valid_parameter_should_ignore_non_pair_values():
     nodes = parse("dimension: name { hidden: {} }")
     assert not block_has_valid_parameter(nodes[0], parameter_name="hidden", value="yes")